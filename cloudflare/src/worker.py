@@ -6,43 +6,184 @@ Cloudflare Workers using Streamable HTTP transport.
 Note: Cloudflare Python Workers are in beta. Some features may change.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
-from typing import Any
+import time
+from typing import Any, Awaitable, Callable
 
-from js import Response, Headers, fetch
+from js import Object, Response, Headers, fetch
 from pyodide.ffi import to_js
 
 # Base64 encoding for Fivetran API auth
 import base64
 
+# orjson is much faster than the stdlib json module on Pyodide; fall back to
+# json when it is not bundled. Both _dumps variants return UTF-8 bytes.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Seconds a cached GET response stays fresh, and how long before expiry a
+# cache hit starts refreshing the entry in the background.
+_LIST_CACHE_TTL = 30.0
+_SCHEMA_CACHE_TTL = 300.0
+_CACHE_REFRESH_AHEAD = 5.0
+_CACHE_MAX_ENTRIES = 256
+
+# Pre-encoded bodies for the fixed payloads of the most frequent write calls
+_PAUSE_BODY = b'{"paused":true}'
+_RESUME_BODY = b'{"paused":false}'
+_SYNC_BODIES = {False: b'{"force":false}', True: b'{"force":true}'}
+
+
+class FivetranAPIError(Exception):
+    """Fivetran API error with status code and detailed message."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"Fivetran API error ({status_code}): {message}")
+
 
 class FivetranClient:
     """Async HTTP client for Fivetran API (Cloudflare Workers version)."""
 
     BASE_URL = "https://api.fivetran.com/v1"
+    __slots__ = (
+        "api_key", "api_secret", "_auth_header", "_js_headers",
+        "_cache", "_refreshing", "_tables", "_generation",
+    )
 
     def __init__(self, api_key: str, api_secret: str):
         self.api_key = api_key
         self.api_secret = api_secret
-        credentials = f"{api_key}:{api_secret}"
-        self._auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
-
-    async def _request(self, method: str, path: str, data: dict | None = None) -> dict:
-        """Make an authenticated request to Fivetran API."""
-        url = f"{self.BASE_URL}{path}"
-        headers = to_js({
+        self._auth_header = _basic_auth(api_key, api_secret)
+        # Built once: request headers are the same for every call
+        self._js_headers = Headers.new(to_js({
             "Authorization": self._auth_header,
             "Content-Type": "application/json",
             "Accept": "application/json",
-        })
-
+        }))
+        # path -> (expires_at, etag, response)
+        self._cache: dict[str, tuple[float, str | None, dict]] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._tables: dict[str, tuple[dict, list[dict]]] = {}
+        # Bumped by every invalidation, so a read that was in flight during a
+        # write can tell that its response may predate the write
+        self._generation = 0
+
+    async def _request(self, method: str, path: str, data: dict | bytes | None = None) -> dict:
+        """Make an authenticated request to Fivetran API.
+
+        GET responses for list and schema endpoints are cached and shared
+        between callers, so they must not be mutated. Entries close to expiry
+        are refreshed in the background, expired ones are revalidated with
+        their ETag, and writes drop stale entries.
+        """
+        ttl = _cache_ttl(path) if method == "GET" else None
+        if ttl is not None:
+            cached = self._cache.get(path)
+            remaining = cached[0] - time.monotonic() if cached else 0
+            if remaining > 0:
+                if remaining < _CACHE_REFRESH_AHEAD and path not in self._refreshing:
+                    task = run_in_background(self._refresh(path, ttl))
+                    self._refreshing[path] = task
+                    task.add_done_callback(lambda _: self._refreshing.pop(path, None))
+                return cached[2]
+            return await self._revalidate(path, ttl, cached)
+
+        _, _, result = await self._fetch(method, path, data)
+        if method != "GET":
+            # Every write endpoint lives under /connectors/{connection_id}
+            self._invalidate(path.split("/")[2])
+        return result
+
+    async def _revalidate(self, path: str, ttl: float, cached: tuple | None) -> dict:
+        """Fetch a cacheable GET response, reusing the cached body on 304 Not Modified."""
+        etag = cached[1] if cached else None
+        generation = self._generation
+        status, new_etag, result = await self._fetch("GET", path, etag=etag)
+        if status == 304 and cached:
+            new_etag, result = etag, cached[2]
+        # A write invalidated the cache while this read was in flight, so the
+        # response may show the connection's old state; don't cache it
+        if self._generation == generation:
+            self._store(path, ttl, new_etag, result)
+        return result
+
+    async def _refresh(self, path: str, ttl: float) -> None:
+        """Revalidate a cached GET response, keeping the old one on failure."""
+        try:
+            await self._revalidate(path, ttl, self._cache.get(path))
+        except Exception:
+            pass
+
+    def _store(self, path: str, ttl: float, etag: str | None, result: dict) -> None:
+        """Cache a GET response, evicting the oldest entry when full."""
+        previous = self._cache.pop(path, None)
+        if previous is not None and previous[2] is not result:
+            self._forget_tables(path)
+        self._cache[path] = (time.monotonic() + ttl, etag, result)
+        if len(self._cache) > _CACHE_MAX_ENTRIES:
+            oldest = next(iter(self._cache))
+            del self._cache[oldest]
+            self._forget_tables(oldest)
+
+    def _forget_tables(self, path: str) -> None:
+        """Drop the list_tables memo built from a /schemas response leaving the cache."""
+        if path.endswith("/schemas"):
+            self._tables.pop(path.split("/")[2], None)
+
+    def _invalidate(self, connection_id: str) -> None:
+        """Drop cached responses that may reflect a connection's previous state."""
+        self._generation += 1
+        for path in list(self._cache):
+            if connection_id in path or _is_connection_list(path):
+                del self._cache[path]
+        self._tables.pop(connection_id, None)
+
+    async def _fetch(
+        self, method: str, path: str, data: dict | bytes | None = None, etag: str | None = None
+    ) -> tuple[int, str | None, dict]:
+        """Send a request and return its status code, ETag and parsed body.
+
+        Raises:
+            FivetranAPIError: When the API returns an error status, or a body
+                whose code is not "Success"
+        """
+        url = f"{self.BASE_URL}{path}"
+        headers = self._js_headers
+        if etag:
+            headers = Headers.new(self._js_headers)
+            headers.set("If-None-Match", etag)
         options = {"method": method, "headers": headers}
         if data:
-            options["body"] = json.dumps(data)
-
-        response = await fetch(url, to_js(options, dict_converter=lambda d: d))
-        text = await response.text()
-        return json.loads(text) if text else {}
+            options["body"] = data if isinstance(data, bytes) else _dumps(data)
+
+        response = await fetch(url, to_js(options, dict_converter=Object.fromEntries))
+        # Parse the raw UTF-8 bytes rather than response.text(), which would
+        # decode the body into a JS string only to copy it into a Python str.
+        body = (await response.arrayBuffer()).to_bytes()
+        status = response.status
+        if status == 304:
+            return status, response.headers.get("ETag"), {}
+        try:
+            result = _loads(body) if body else {}
+        except ValueError:
+            result = {"message": body.decode(errors="replace")}
+        code = result.get("code", "Success")
+        if not 200 <= status < 300 or code != "Success":
+            raise FivetranAPIError(status, result.get("message") or result.get("code") or "Unknown error")
+        return status, response.headers.get("ETag"), result
 
     async def list_connections(self, limit: int = 100) -> dict:
         return await self._request("GET", f"/connections?limit={limit}")
@@ -54,28 +195,25 @@ class FivetranClient:
         return await self._request("GET", f"/connectors/{connection_id}")
 
     async def trigger_sync(self, connection_id: str, force: bool = False) -> dict:
-        return await self._request("POST", f"/connectors/{connection_id}/sync", {"force": force})
+        return await self._request("POST", f"/connectors/{connection_id}/sync", _SYNC_BODIES[bool(force)])
 
     async def trigger_resync(self, connection_id: str) -> dict:
         return await self._request("POST", f"/connectors/{connection_id}/resync")
 
     async def resync_tables(self, connection_id: str, tables: list[str]) -> dict:
-        # Parse tables into schema/table format
-        table_objects = {}
+        # Group "schema.table" names by schema, skipping names without a schema
+        table_objects: dict[str, dict] = {}
         for table in tables:
-            parts = table.split(".", 1)
-            if len(parts) == 2:
-                schema, table_name = parts
-                if schema not in table_objects:
-                    table_objects[schema] = {"tables": {}}
-                table_objects[schema]["tables"][table_name] = {}
+            schema, sep, table_name = table.partition(".")
+            if sep:
+                table_objects.setdefault(schema, {"tables": {}})["tables"][table_name] = {}
         return await self._request("POST", f"/connectors/{connection_id}/schemas/tables/resync", {"schemas": table_objects})
 
     async def pause_connection(self, connection_id: str) -> dict:
-        return await self._request("PATCH", f"/connectors/{connection_id}", {"paused": True})
+        return await self._request("PATCH", f"/connectors/{connection_id}", _PAUSE_BODY)
 
     async def resume_connection(self, connection_id: str) -> dict:
-        return await self._request("PATCH", f"/connectors/{connection_id}", {"paused": False})
+        return await self._request("PATCH", f"/connectors/{connection_id}", _RESUME_BODY)
 
     async def list_groups(self, limit: int = 100) -> dict:
         return await self._request("GET", f"/groups?limit={limit}")
@@ -86,6 +224,33 @@ class FivetranClient:
     async def get_schema(self, connection_id: str) -> dict:
         return await self._request("GET", f"/connectors/{connection_id}/schemas")
 
+    async def list_tables(self, connection_id: str) -> list[dict]:
+        """Flatten a connection's schema into a list of tables.
+
+        Shares the cached /schemas response with get_schema and reuses the
+        flattened list for as long as that response stays cached. The memo is
+        dropped whenever the response is replaced, evicted or invalidated,
+        so it never outlives or outnumbers the cached schemas.
+        """
+        schema = await self.get_schema(connection_id)
+        memo = self._tables.get(connection_id)
+        if memo is not None and memo[0] is schema:
+            return memo[1]
+
+        tables = []
+        schemas = (schema.get("data") or {}).get("schemas") or {}
+        for schema_name, schema_data in schemas.items():
+            for table_name, table_data in (schema_data.get("tables") or {}).items():
+                tables.append({
+                    "schema": schema_name,
+                    "table": table_name,
+                    "full_name": f"{schema_name}.{table_name}",
+                    "enabled": table_data.get("enabled", False),
+                    "sync_mode": table_data.get("sync_mode"),
+                })
+        self._tables[connection_id] = (schema, tables)
+        return tables
+
     async def get_table_columns(self, connection_id: str, schema: str, table: str) -> dict:
         return await self._request("GET", f"/connectors/{connection_id}/schemas/{schema}/tables/{table}/columns")
 
@@ -93,135 +258,113 @@ class FivetranClient:
         return await self._request("POST", f"/connectors/{connection_id}/schemas/reload")
 
 
-# Tool definitions for MCP
-TOOLS = {
-    "list_connections": {
-        "description": "List all Fivetran connections in the account",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "limit": {"type": "integer", "default": 100, "description": "Maximum number of connections to return"},
-                "group_id": {"type": "string", "description": "Optional group ID to filter connections"},
-            },
-        },
-    },
-    "get_connection_status": {
-        "description": "Get detailed status for a specific Fivetran connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "trigger_sync": {
-        "description": "Trigger a data sync for a Fivetran connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-                "force": {"type": "boolean", "default": False, "description": "Force sync even if one is in progress"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "trigger_resync": {
-        "description": "Trigger a full historical resync for a connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "resync_tables": {
-        "description": "Resync specific tables within a connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-                "tables": {"type": "array", "items": {"type": "string"}, "description": "List of table names (schema.table)"},
-            },
-            "required": ["connection_id", "tables"],
-        },
-    },
-    "pause_connection": {
-        "description": "Pause a Fivetran connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "resume_connection": {
-        "description": "Resume a paused Fivetran connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "list_groups": {
-        "description": "List all Fivetran groups (destinations)",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "limit": {"type": "integer", "default": 100, "description": "Maximum number of groups to return"},
-            },
-        },
-    },
-    "test_connection": {
-        "description": "Test a Fivetran connection to diagnose issues",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "get_schema": {
-        "description": "Get complete schema configuration for a connection",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "list_tables": {
-        "description": "List all tables in a connection with sync status",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-    "reload_schema": {
-        "description": "Reload schema configuration from the source",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "connection_id": {"type": "string", "description": "The unique identifier of the connection"},
-            },
-            "required": ["connection_id"],
-        },
-    },
-}
+@functools.lru_cache(maxsize=8)
+def _basic_auth(api_key: str, api_secret: str) -> str:
+    """Build the Basic auth header value for a pair of API credentials."""
+    credentials = f"{api_key}:{api_secret}"
+    return f"Basic {base64.b64encode(credentials.encode()).decode()}"
+
+
+def _cache_ttl(path: str) -> float | None:
+    """Return how long a GET response for the path may be cached, if at all."""
+    base = path.partition("?")[0]
+    if base.endswith("/schemas"):
+        return _SCHEMA_CACHE_TTL
+    if base == "/groups" or _is_connection_list(base):
+        return _LIST_CACHE_TTL
+    return None
+
+
+def _is_connection_list(path: str) -> bool:
+    """Check whether the path lists connections, in the account or a group."""
+    base = path.partition("?")[0]
+    return base == "/connections" or (base.startswith("/groups/") and base.endswith("/connectors"))
+
+
+# The execution context of the request being handled. Tasks copy it when
+# they are created, so background work started by a request, including
+# work started later from its own background tasks, is registered with
+# that request's ctx rather than with whichever request happens to be
+# running when it finishes.
+_request_ctx: contextvars.ContextVar[Any] = contextvars.ContextVar("_request_ctx", default=None)
+
+
+def run_in_background(coro) -> asyncio.Task:
+    """Start a task and keep the current request's isolate alive until it finishes."""
+    task = asyncio.create_task(coro)
+    ctx = _request_ctx.get()
+    if ctx is not None:
+        ctx.waitUntil(task)
+    return task
+
+
+# Clients are reused across requests handled by the same isolate so that
+# outbound connections to api.fivetran.com stay warm between tool calls.
+_CLIENTS: dict[tuple[str, str], FivetranClient] = {}
+
+
+def _get_client(api_key: str, api_secret: str) -> FivetranClient:
+    """Get or create the Fivetran client for the given credentials."""
+    key = (api_key, api_secret)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = _CLIENTS[key] = FivetranClient(api_key, api_secret)
+    return client
+
+
+# Maximum number of Fivetran requests a batch keeps in flight at once.
+_BATCH_CONCURRENCY = 10
+
+# Number of connections from list_connections whose schemas are prefetched.
+_PREFETCH_LIMIT = 10
+
+# Tool definitions for MCP and the handler behind each, filled in by @tool
+TOOLS: dict[str, dict] = {}
+_HANDLERS: dict[str, Callable[[FivetranClient, dict], Awaitable[dict]]] = {}
+_BATCH_TOOLS: set[str] = set()
+
+_CONNECTION_ID = {"type": "string", "description": "The unique identifier of the connection"}
+_CONNECTION_IDS = {"type": "array", "items": {"type": "string"}, "description": "The unique identifiers of the connections"}
+
+
+def tool(name: str, description: str, required: tuple[str, ...] = (), batch: bool = False, **properties: dict):
+    """Register an async handler(client, args) as an MCP tool.
+
+    Keyword arguments are the JSON schemas of the tool's parameters. With
+    batch=True a "<name>_batch" variant is also registered that takes
+    connection_ids instead of connection_id and runs the tool concurrently.
+    """
+
+    def register(handler):
+        _register(name, description, properties, required, handler)
+        if batch:
+            batch_properties = {"connection_ids": _CONNECTION_IDS}
+            batch_properties.update((k, v) for k, v in properties.items() if k != "connection_id")
+            _register(
+                f"{name}_batch",
+                f"{description} (multiple connections, run concurrently)",
+                batch_properties,
+                ("connection_ids",),
+                _batch_handler(handler),
+            )
+            _BATCH_TOOLS.add(f"{name}_batch")
+        return handler
+
+    return register
+
+
+def _register(name: str, description: str, properties: dict, required: tuple[str, ...], handler) -> None:
+    """Add a tool definition and its handler to the registry."""
+    parameters = {"type": "object", "properties": properties}
+    if required:
+        parameters["required"] = list(required)
+    TOOLS[name] = {"description": description, "parameters": parameters}
+    _HANDLERS[name] = handler
 
 
 def _extract_connection_summary(conn: dict) -> dict:
     """Extract a summary of connection data."""
-    status = conn.get("status", {})
+    status = conn.get("status") or {}
     return {
         "id": conn.get("id"),
         "schema": conn.get("schema"),
@@ -236,129 +379,301 @@ def _extract_connection_summary(conn: dict) -> dict:
     }
 
 
+async def _gather_bounded(calls: list) -> list[dict]:
+    """Await tool calls concurrently, at most _BATCH_CONCURRENCY at a time.
+
+    A call that raises is reported as {"error": message} in its slot instead
+    of failing the others. Tool results never have an "error" key of their
+    own. Cancellation is not caught and propagates.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run(call):
+        async with semaphore:
+            try:
+                return await call
+            except Exception as e:
+                # Some errors have an empty message; fall back to their type
+                return {"error": str(e) or type(e).__name__}
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+def _batch_handler(handler):
+    """Wrap a single-connection handler to run it for every ID in args["connection_ids"]."""
+
+    async def handle_batch(client: FivetranClient, args: dict) -> dict:
+        connection_ids = args["connection_ids"]
+        shared_args = {k: v for k, v in args.items() if k != "connection_ids"}
+        results = await _gather_bounded([
+            handler(client, {**shared_args, "connection_id": cid}) for cid in connection_ids
+        ])
+        results = [
+            {"connection_id": cid, **r} if "error" in r else r
+            for cid, r in zip(connection_ids, results)
+        ]
+        return {"results": results, "count": len(results), "error_count": sum(1 for r in results if "error" in r)}
+
+    return handle_batch
+
+
+def _check_arguments(tool_name: str, args: Any) -> str | None:
+    """Return why a tool's arguments can't be run, or None if they are valid."""
+    if tool_name in _BATCH_TOOLS:
+        connection_ids = args.get("connection_ids") if isinstance(args, dict) else None
+        if not isinstance(connection_ids, list) or not all(isinstance(cid, str) for cid in connection_ids):
+            return f"{tool_name}: 'connection_ids' must be a list of strings"
+    return None
+
+
+async def _warm_schema(client: FivetranClient, connection_id: str) -> None:
+    """Load a connection's schema into the client cache, ignoring failures."""
+    try:
+        await client.get_schema(connection_id)
+    except Exception:
+        pass
+
+
+@tool(
+    "list_connections",
+    "List all Fivetran connections in the account",
+    limit={"type": "integer", "default": 100, "description": "Maximum number of connections to return"},
+    group_id={"type": "string", "description": "Optional group ID to filter connections"},
+    prefetch={"type": "boolean", "default": True, "description": "Warm the schema cache for the first connections returned"},
+)
+async def _handle_list_connections(client: FivetranClient, args: dict) -> dict:
+    limit = args.get("limit", 100)
+    group_id = args.get("group_id")
+    if group_id:
+        result = await client.list_connections_in_group(group_id, limit=limit)
+    else:
+        result = await client.list_connections(limit=limit)
+    items = (result.get("data") or {}).get("items") or ()
+    connections = [_extract_connection_summary(conn) for conn in items]
+    if args.get("prefetch", True):
+        # Agents usually inspect a few of the listed connections next
+        for conn in connections[:_PREFETCH_LIMIT]:
+            if conn["id"]:
+                run_in_background(_warm_schema(client, conn["id"]))
+    return {"connections": connections, "count": len(connections)}
+
+
+@tool(
+    "get_connection_status",
+    "Get detailed status for a specific Fivetran connection",
+    required=("connection_id",),
+    batch=True,
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_get_connection_status(client: FivetranClient, args: dict) -> dict:
+    result = await client.get_connection(args["connection_id"])
+    data = result.get("data") or {}
+    status = data.get("status") or {}
+    tasks = [{"code": t.get("code"), "message": t.get("message"), "details": t.get("details")} for t in status.get("tasks") or ()]
+    warnings = [{"code": w.get("code"), "message": w.get("message"), "details": w.get("details")} for w in status.get("warnings") or ()]
+    return {
+        "id": data.get("id"),
+        "schema": data.get("schema"),
+        "service": data.get("service"),
+        "group_id": data.get("group_id"),
+        "paused": data.get("paused"),
+        "status": {
+            "sync_state": status.get("sync_state"),
+            "setup_state": status.get("setup_state"),
+            "update_state": status.get("update_state"),
+            "is_historical_sync": status.get("is_historical_sync"),
+        },
+        "tasks": tasks,
+        "warnings": warnings,
+        "succeeded_at": data.get("succeeded_at"),
+        "failed_at": data.get("failed_at"),
+    }
+
+
+@tool(
+    "trigger_sync",
+    "Trigger a data sync for a Fivetran connection",
+    required=("connection_id",),
+    batch=True,
+    connection_id=_CONNECTION_ID,
+    force={"type": "boolean", "default": False, "description": "Force sync even if one is in progress"},
+)
+async def _handle_trigger_sync(client: FivetranClient, args: dict) -> dict:
+    await client.trigger_sync(args["connection_id"], force=args.get("force", False))
+    return {"success": True, "message": "Sync triggered successfully", "connection_id": args["connection_id"]}
+
+
+@tool(
+    "trigger_resync",
+    "Trigger a full historical resync for a connection",
+    required=("connection_id",),
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_trigger_resync(client: FivetranClient, args: dict) -> dict:
+    await client.trigger_resync(args["connection_id"])
+    return {"success": True, "message": "Historical resync triggered successfully", "connection_id": args["connection_id"]}
+
+
+@tool(
+    "resync_tables",
+    "Resync specific tables within a connection",
+    required=("connection_id", "tables"),
+    connection_id=_CONNECTION_ID,
+    tables={"type": "array", "items": {"type": "string"}, "description": "List of table names (schema.table)"},
+)
+async def _handle_resync_tables(client: FivetranClient, args: dict) -> dict:
+    await client.resync_tables(args["connection_id"], args["tables"])
+    return {"success": True, "message": "Table resync triggered successfully", "connection_id": args["connection_id"], "tables": args["tables"]}
+
+
+@tool(
+    "pause_connection",
+    "Pause a Fivetran connection",
+    required=("connection_id",),
+    batch=True,
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_pause_connection(client: FivetranClient, args: dict) -> dict:
+    await client.pause_connection(args["connection_id"])
+    return {"success": True, "connection_id": args["connection_id"], "paused": True, "message": "Connection paused successfully"}
+
+
+@tool(
+    "resume_connection",
+    "Resume a paused Fivetran connection",
+    required=("connection_id",),
+    batch=True,
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_resume_connection(client: FivetranClient, args: dict) -> dict:
+    await client.resume_connection(args["connection_id"])
+    return {"success": True, "connection_id": args["connection_id"], "paused": False, "message": "Connection resumed successfully"}
+
+
+@tool(
+    "list_groups",
+    "List all Fivetran groups (destinations)",
+    limit={"type": "integer", "default": 100, "description": "Maximum number of groups to return"},
+)
+async def _handle_list_groups(client: FivetranClient, args: dict) -> dict:
+    result = await client.list_groups(limit=args.get("limit", 100))
+    items = (result.get("data") or {}).get("items") or ()
+    groups = [{"id": g.get("id"), "name": g.get("name"), "created_at": g.get("created_at")} for g in items]
+    return {"groups": groups, "count": len(groups)}
+
+
+@tool(
+    "test_connection",
+    "Test a Fivetran connection to diagnose issues",
+    required=("connection_id",),
+    batch=True,
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_test_connection(client: FivetranClient, args: dict) -> dict:
+    result = await client.test_connection(args["connection_id"])
+    tests = []
+    passed = failed = 0
+    for t in (result.get("data") or {}).get("setup_tests") or ():
+        status = t.get("status", "UNKNOWN")
+        tests.append({"title": t.get("title"), "status": status, "message": t.get("message")})
+        if status == "PASSED":
+            passed += 1
+        elif status == "FAILED":
+            failed += 1
+    return {
+        "connection_id": args["connection_id"],
+        "overall_status": "PASSED" if failed == 0 and passed > 0 else "FAILED",
+        "passed_count": passed,
+        "failed_count": failed,
+        "tests": tests,
+    }
+
+
+@tool(
+    "get_schema",
+    "Get complete schema configuration for a connection",
+    required=("connection_id",),
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_get_schema(client: FivetranClient, args: dict) -> dict:
+    result = await client.get_schema(args["connection_id"])
+    data = result.get("data") or {}
+    return {"connection_id": args["connection_id"], "schema_change_handling": data.get("schema_change_handling"), "schemas": data.get("schemas") or {}}
+
+
+@tool(
+    "list_tables",
+    "List all tables in a connection with sync status",
+    required=("connection_id",),
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_list_tables(client: FivetranClient, args: dict) -> dict:
+    tables = await client.list_tables(args["connection_id"])
+    return {"connection_id": args["connection_id"], "tables": tables, "count": len(tables)}
+
+
+@tool(
+    "reload_schema",
+    "Reload schema configuration from the source",
+    required=("connection_id",),
+    connection_id=_CONNECTION_ID,
+)
+async def _handle_reload_schema(client: FivetranClient, args: dict) -> dict:
+    await client.reload_schema(args["connection_id"])
+    return {"success": True, "connection_id": args["connection_id"], "message": "Schema reload triggered successfully"}
+
+
+# TOOLS never changes after import, so the /tools response is encoded once
+_TOOL_NAMES = frozenset(TOOLS)
+_TOOLS_JSON = _dumps({"tools": TOOLS})
+
+
 async def execute_tool(client: FivetranClient, tool_name: str, args: dict) -> dict:
     """Execute an MCP tool and return the result."""
-    if tool_name == "list_connections":
-        limit = args.get("limit", 100)
-        group_id = args.get("group_id")
-        if group_id:
-            result = await client.list_connections_in_group(group_id, limit=limit)
-        else:
-            result = await client.list_connections(limit=limit)
-        connections = [_extract_connection_summary(conn) for conn in result.get("data", {}).get("items", [])]
-        return {"connections": connections, "count": len(connections)}
-
-    elif tool_name == "get_connection_status":
-        result = await client.get_connection(args["connection_id"])
-        data = result.get("data", {})
-        status = data.get("status", {})
-        tasks = [{"code": t.get("code"), "message": t.get("message"), "details": t.get("details")} for t in status.get("tasks", [])]
-        warnings = [{"code": w.get("code"), "message": w.get("message"), "details": w.get("details")} for w in status.get("warnings", [])]
-        return {
-            "id": data.get("id"),
-            "schema": data.get("schema"),
-            "service": data.get("service"),
-            "group_id": data.get("group_id"),
-            "paused": data.get("paused"),
-            "status": {
-                "sync_state": status.get("sync_state"),
-                "setup_state": status.get("setup_state"),
-                "update_state": status.get("update_state"),
-                "is_historical_sync": status.get("is_historical_sync"),
-            },
-            "tasks": tasks,
-            "warnings": warnings,
-            "succeeded_at": data.get("succeeded_at"),
-            "failed_at": data.get("failed_at"),
-        }
-
-    elif tool_name == "trigger_sync":
-        await client.trigger_sync(args["connection_id"], force=args.get("force", False))
-        return {"success": True, "message": "Sync triggered successfully", "connection_id": args["connection_id"]}
-
-    elif tool_name == "trigger_resync":
-        await client.trigger_resync(args["connection_id"])
-        return {"success": True, "message": "Historical resync triggered successfully", "connection_id": args["connection_id"]}
-
-    elif tool_name == "resync_tables":
-        await client.resync_tables(args["connection_id"], args["tables"])
-        return {"success": True, "message": "Table resync triggered successfully", "connection_id": args["connection_id"], "tables": args["tables"]}
-
-    elif tool_name == "pause_connection":
-        await client.pause_connection(args["connection_id"])
-        return {"success": True, "connection_id": args["connection_id"], "paused": True, "message": "Connection paused successfully"}
-
-    elif tool_name == "resume_connection":
-        await client.resume_connection(args["connection_id"])
-        return {"success": True, "connection_id": args["connection_id"], "paused": False, "message": "Connection resumed successfully"}
-
-    elif tool_name == "list_groups":
-        result = await client.list_groups(limit=args.get("limit", 100))
-        groups = [{"id": g.get("id"), "name": g.get("name"), "created_at": g.get("created_at")} for g in result.get("data", {}).get("items", [])]
-        return {"groups": groups, "count": len(groups)}
-
-    elif tool_name == "test_connection":
-        result = await client.test_connection(args["connection_id"])
-        data = result.get("data", {})
-        tests = [{"title": t.get("title"), "status": t.get("status", "UNKNOWN"), "message": t.get("message")} for t in data.get("setup_tests", [])]
-        passed = sum(1 for t in tests if t["status"] == "PASSED")
-        failed = sum(1 for t in tests if t["status"] == "FAILED")
-        return {
-            "connection_id": args["connection_id"],
-            "overall_status": "PASSED" if failed == 0 and passed > 0 else "FAILED",
-            "passed_count": passed,
-            "failed_count": failed,
-            "tests": tests,
-        }
-
-    elif tool_name == "get_schema":
-        result = await client.get_schema(args["connection_id"])
-        data = result.get("data", {})
-        return {"connection_id": args["connection_id"], "schema_change_handling": data.get("schema_change_handling"), "schemas": data.get("schemas", {})}
-
-    elif tool_name == "list_tables":
-        result = await client.get_schema(args["connection_id"])
-        schemas = result.get("data", {}).get("schemas", {})
-        tables = []
-        for schema_name, schema_data in schemas.items():
-            for table_name, table_data in schema_data.get("tables", {}).items():
-                tables.append({
-                    "schema": schema_name,
-                    "table": table_name,
-                    "full_name": f"{schema_name}.{table_name}",
-                    "enabled": table_data.get("enabled", False),
-                    "sync_mode": table_data.get("sync_mode"),
-                })
-        return {"connection_id": args["connection_id"], "tables": tables, "count": len(tables)}
+    handler = _HANDLERS.get(tool_name)
+    if handler is None:
+        return {"error": f"Unknown tool: {tool_name}"}
+    return await handler(client, args)
 
-    elif tool_name == "reload_schema":
-        await client.reload_schema(args["connection_id"])
-        return {"success": True, "connection_id": args["connection_id"], "message": "Schema reload triggered successfully"}
 
-    else:
-        return {"error": f"Unknown tool: {tool_name}"}
+# Response headers are constant; Response.new copies them into each response
+_JSON_HEADERS = Headers.new(to_js({"Content-Type": "application/json"}))
+_CORS_HEADERS = Headers.new(to_js({
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}))
 
 
 def json_response(data: Any, status: int = 200) -> Response:
     """Create a JSON response."""
-    headers = Headers.new(to_js({"Content-Type": "application/json"}))
-    return Response.new(json.dumps(data), to_js({"status": status, "headers": headers}))
+    return _raw_response(_dumps(data), status)
 
 
-async def on_fetch(request, env) -> Response:
+def _raw_response(body: bytes, status: int = 200) -> Response:
+    """Create a JSON response from an already-encoded body."""
+    return Response.new(to_js(body), to_js({"status": status, "headers": _JSON_HEADERS}))
+
+
+def _last_path_segment(url: str) -> str:
+    """Return the last path segment of a URL, ignoring the query and a trailing slash."""
+    end = url.find("?")
+    if end < 0:
+        end = len(url)
+    if end > 0 and url[end - 1] == "/":
+        end -= 1
+    return url[url.rfind("/", 0, end) + 1:end]
+
+
+async def on_fetch(request, env, ctx) -> Response:
     """Handle incoming HTTP requests (Cloudflare Workers entry point)."""
     url = request.url
     method = request.method
-    path = url.split("?")[0].rstrip("/").split("/")[-1] if "/" in url else ""
+    path = _last_path_segment(url)
 
     # CORS preflight
     if method == "OPTIONS":
-        headers = Headers.new(to_js({
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        }))
-        return Response.new("", to_js({"status": 204, "headers": headers}))
+        return Response.new("", to_js({"status": 204, "headers": _CORS_HEADERS}))
 
     # Health check
     if path == "" or path == "health":
@@ -375,20 +690,35 @@ async def on_fetch(request, env) -> Response:
 
     # List available tools
     if path == "tools":
-        return json_response({"tools": TOOLS})
+        return _raw_response(_TOOLS_JSON)
 
     # Execute tool
     if path == "execute" and method == "POST":
         try:
             body = await request.text()
-            data = json.loads(body)
+            data = _loads(body)
             tool_name = data.get("tool")
             args = data.get("arguments", {})
 
             if not tool_name:
                 return json_response({"error": "Missing 'tool' field"}, 400)
-            if tool_name not in TOOLS:
-                return json_response({"error": f"Unknown tool: {tool_name}"}, 400)
+
+            # A list of tools executes them concurrently, pairing each with
+            # the argument object at the same position.
+            is_batch = isinstance(tool_name, list)
+            tool_names = tool_name if is_batch else [tool_name]
+            if is_batch:
+                if not args:
+                    args = [{} for _ in tool_names]
+                if not isinstance(args, list) or len(args) != len(tool_names):
+                    return json_response({"error": "'arguments' must be a list matching 'tool'"}, 400)
+            for name, tool_args in zip(tool_names, args if is_batch else [args]):
+                if name not in _TOOL_NAMES:
+                    return json_response({"error": f"Unknown tool: {name}"}, 400)
+                # Validate everything up front so no call starts for a bad request
+                error = _check_arguments(name, tool_args)
+                if error:
+                    return json_response({"error": error}, 400)
 
             # Get API credentials from environment
             api_key = getattr(env, "FIVETRAN_API_KEY", None)
@@ -397,9 +727,21 @@ async def on_fetch(request, env) -> Response:
             if not api_key or not api_secret:
                 return json_response({"error": "FIVETRAN_API_KEY and FIVETRAN_API_SECRET must be configured"}, 500)
 
-            client = FivetranClient(api_key, api_secret)
-            result = await execute_tool(client, tool_name, args)
-            return json_response({"result": result})
+            client = _get_client(api_key, api_secret)
+            token = _request_ctx.set(ctx)
+            try:
+                if is_batch:
+                    results = await _gather_bounded([
+                        execute_tool(client, name, tool_args) for name, tool_args in zip(tool_names, args)
+                    ])
+                    return json_response({"results": [
+                        r if "error" in r else {"result": r} for r in results
+                    ]})
+
+                result = await execute_tool(client, tool_name, args)
+                return json_response({"result": result})
+            finally:
+                _request_ctx.reset(token)
 
         except json.JSONDecodeError:
             return json_response({"error": "Invalid JSON"}, 400)
@@ -1,9 +1,19 @@
 """Fivetran API client using httpx."""
 
 import base64
+import functools
+import time
 from typing import Any
 
 import httpx
+import orjson
+
+# Seconds a cached GET response stays fresh. Schemas change rarely; connection
+# and group lists are refreshed more often so sync state does not go stale.
+_CONNECTION_CACHE_TTL = 3.0
+_LIST_CACHE_TTL = 30.0
+_SCHEMA_CACHE_TTL = 300.0
+_CACHE_MAX_ENTRIES = 256
 
 
 class FivetranAPIError(Exception):
@@ -19,17 +29,28 @@ class FivetranClient:
     """Async HTTP client for Fivetran REST API."""
 
     BASE_URL = "https://api.fivetran.com"
+    __slots__ = ("_client", "_cache", "_generation")
 
     def __init__(self, api_key: str, api_secret: str) -> None:
-        credentials = base64.b64encode(f"{api_key}:{api_secret}".encode()).decode()
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             headers={
-                "Authorization": f"Basic {credentials}",
+                "Authorization": _basic_auth(api_key, api_secret),
                 "Content-Type": "application/json",
             },
-            timeout=30.0,
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=5.0, pool=5.0),
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+            ),
+            http2=True,
         )
+        # (path, query) -> (expires_at, etag, response)
+        self._cache: dict[
+            tuple[str, str], tuple[float, str | None, dict[str, Any]]
+        ] = {}
+        # Bumped by every invalidation, so a read that was in flight during a
+        # write can tell that its response may predate the write
+        self._generation = 0
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -214,21 +235,109 @@ class FivetranClient:
     ) -> dict[str, Any]:
         """Make an API request and return the JSON response.
 
+        GET responses for list and schema endpoints are cached for a short time
+        and shared between callers, so they must not be mutated. Once an entry
+        expires it is revalidated with its ETag, reusing the cached body on a
+        304. Any write to a connection drops the cached responses it may have
+        made stale.
+
         Raises:
             FivetranAPIError: When the API returns an error response with details
         """
-        response = await self._client.request(method, path, params=params, json=json)
+        ttl = _cache_ttl(path) if method == "GET" else None
+        if ttl is not None:
+            return await self._cached_get(path, params, ttl)
 
-        if not response.is_success:
-            # Extract error message from Fivetran's response body
-            try:
-                error_data = response.json()
-                error_msg = error_data.get("message", str(error_data))
-            except Exception:
-                error_msg = response.text or response.reason_phrase or "Unknown error"
-            raise FivetranAPIError(response.status_code, error_msg)
-
-        return response.json()
+        response = await self._client.request(method, path, params=params, json=json)
+        data = _parse_response(response)
+        if method != "GET":
+            # Every write endpoint lives under /v1/connections/{connection_id}
+            self._invalidate(path.split("/")[3])
+        return data
+
+    async def _cached_get(
+        self, path: str, params: dict[str, Any] | None, ttl: float
+    ) -> dict[str, Any]:
+        """GET a cacheable endpoint, serving or revalidating the cached response."""
+        key = (path, str(httpx.QueryParams(params)))
+        headers = None
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._cache[key] = cached
+            if cached[0] > time.monotonic():
+                return cached[2]
+            if cached[1]:
+                headers = {"If-None-Match": cached[1]}
+
+        generation = self._generation
+        response = await self._client.request("GET", path, params=params, headers=headers)
+        # A write invalidated the cache while this read was in flight, so the
+        # response may show the connection's old state; don't cache it
+        stale = self._generation != generation
+
+        if cached is not None and response.status_code == 304:
+            if not stale:
+                self._store(key, ttl, cached[1], cached[2])
+            return cached[2]
+
+        data = _parse_response(response)
+        if not stale:
+            self._store(key, ttl, response.headers.get("ETag"), data)
+        return data
+
+    def _store(
+        self, key: tuple[str, str], ttl: float, etag: str | None, data: dict[str, Any]
+    ) -> None:
+        """Cache a GET response, evicting the least recently used entry when full."""
+        self._cache.pop(key, None)
+        self._cache[key] = (time.monotonic() + ttl, etag, data)
+        if len(self._cache) > _CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+
+    def _invalidate(self, connection_id: str) -> None:
+        """Drop cached responses that may reflect a connection's previous state."""
+        self._generation += 1
+        for key in list(self._cache):
+            if connection_id in key[0] or _is_connection_list(key[0]):
+                del self._cache[key]
+
+
+@functools.lru_cache(maxsize=8)
+def _basic_auth(api_key: str, api_secret: str) -> str:
+    """Build the Basic auth header value for a pair of API credentials."""
+    credentials = base64.b64encode(f"{api_key}:{api_secret}".encode()).decode()
+    return f"Basic {credentials}"
+
+
+def _parse_response(response: httpx.Response) -> dict[str, Any]:
+    """Decode a Fivetran API response, raising FivetranAPIError on failure."""
+    if not response.is_success:
+        # Extract error message from Fivetran's response body
+        try:
+            error_data = orjson.loads(response.content)
+            error_msg = error_data.get("message", str(error_data))
+        except Exception:
+            error_msg = response.text or response.reason_phrase or "Unknown error"
+        raise FivetranAPIError(response.status_code, error_msg)
+    return orjson.loads(response.content)
+
+
+def _cache_ttl(path: str) -> float | None:
+    """Return how long a GET response for the path may be cached, if at all."""
+    if path.endswith("/schemas"):
+        return _SCHEMA_CACHE_TTL
+    if path == "/v1/groups" or _is_connection_list(path):
+        return _LIST_CACHE_TTL
+    if path.startswith("/v1/connections/") and path.count("/") == 3:
+        return _CONNECTION_CACHE_TTL
+    return None
+
+
+def _is_connection_list(path: str) -> bool:
+    """Check whether the path lists connections, in the account or a group."""
+    return path == "/v1/connections" or (
+        path.startswith("/v1/groups/") and path.endswith("/connections")
+    )
 
 
 def _pagination_params(limit: int, cursor: str | None) -> dict[str, Any]:
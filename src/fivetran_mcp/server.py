@@ -1,41 +1,113 @@
 """Fivetran MCP Server - expose Fivetran API operations as MCP tools."""
 
+import asyncio
+import functools
 import os
-from typing import Any
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Any, Final
 
+import orjson
 from fastmcp import FastMCP
 
 from fivetran_mcp.fivetran_api import FivetranClient
 
-mcp = FastMCP(name="Fivetran MCP Server")
+# Confirmation messages for write operations
+_MSG_SYNC: Final = "Sync triggered successfully"
+_MSG_RESYNC: Final = "Historical resync triggered successfully"
+_MSG_TABLES: Final = "Table resync triggered successfully"
+_MSG_RELOAD: Final = "Schema reload triggered successfully"
+_MSG_PAUSE: Final = "Connection paused successfully"
+_MSG_RESUME: Final = "Connection resumed successfully"
+
+# Largest page the Fivetran API returns for list endpoints
+_MAX_PAGE_SIZE = 1000
+
+# Maximum number of Fivetran requests a batch tool keeps in flight at once
+_BATCH_CONCURRENCY = 20
+
+# Shared read-only defaults for missing fields in API responses, so lookups
+# don't allocate a fresh container; never returned in tool results
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_TUPLE: tuple[Any, ...] = ()
+
+# Fields copied into connection summaries from each connection and its status
+_SUMMARY_KEYS = (
+    "id", "schema", "service", "group_id", "paused", "succeeded_at", "failed_at"
+)
+_SUMMARY_STATUS_KEYS = ("sync_state", "setup_state", "is_historical_sync")
+
+# Fields copied into detailed connection status responses
+_DETAIL_KEYS = (
+    "id", "schema", "service", "group_id", "paused", "sync_frequency",
+    "schedule_type", "daily_sync_time", "data_delay_sensitivity",
+    "source_sync_details", "succeeded_at", "failed_at", "created_at",
+)
+_DETAIL_STATUS_KEYS = (
+    "sync_state", "setup_state", "update_state", "is_historical_sync",
+    "rescheduled_for", "schema_status",
+)
+_NOTICE_KEYS = ("code", "message", "details")
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Build the shared Fivetran client on startup and close it on shutdown."""
+    try:
+        _get_client()
+    except ValueError:
+        # Missing credentials are reported by each tool call instead
+        pass
+    try:
+        yield
+    finally:
+        if _get_client.cache_info().currsize:
+            client = _get_client()
+            _get_client.cache_clear()
+            await client.close()
+
 
-_client: FivetranClient | None = None
+def _serialize_result(data: Any) -> str:
+    """Serialize a tool result to JSON text with orjson."""
+    return orjson.dumps(data, default=str).decode()
+
+
+mcp = FastMCP(
+    name="Fivetran MCP Server", lifespan=_lifespan, tool_serializer=_serialize_result
+)
 
 
 @mcp.tool
 async def list_connections(
-    limit: int = 100, group_id: str | None = None
+    limit: int = 100, group_id: str | None = None, cursor: str | None = None
 ) -> dict[str, Any]:
     """List all Fivetran connections in the account.
 
     Args:
         limit: Maximum number of connections to return (1-1000, default 100)
         group_id: Optional group ID to filter connections by group
+        cursor: Pagination cursor from a previous call's next_cursor
 
     Returns:
-        Dictionary containing list of connections with their IDs, names, status, and sync state
+        Dictionary containing list of connections with their IDs, names, status, and sync state,
+        plus next_cursor for fetching the next page (None on the last page)
     """
+    limit = max(1, min(limit, _MAX_PAGE_SIZE))
     client = _get_client()
     if group_id:
-        result = await client.list_connections_in_group(group_id, limit=limit)
+        result = await client.list_connections_in_group(group_id, limit=limit, cursor=cursor)
     else:
-        result = await client.list_connections(limit=limit)
+        result = await client.list_connections(limit=limit, cursor=cursor)
 
-    connections = [
-        _extract_connection_summary(conn)
-        for conn in result.get("data", {}).get("items", [])
-    ]
-    return {"connections": connections, "count": len(connections)}
+    data = result.get("data") or _EMPTY_DICT
+    connections = list(map(_extract_connection_summary, data.get("items") or _EMPTY_TUPLE))
+    return {
+        "connections": connections,
+        "count": len(connections),
+        "next_cursor": data.get("next_cursor"),
+    }
 
 
 @mcp.tool
@@ -55,54 +127,7 @@ async def get_connection_status(connection_id: str) -> dict[str, Any]:
     """
     client = _get_client()
     result = await client.get_connection(connection_id)
-    data = result.get("data", {})
-    status = data.get("status", {})
-
-    # Extract tasks with full details for troubleshooting
-    tasks = [
-        {
-            "code": task.get("code"),
-            "message": task.get("message"),
-            "details": task.get("details"),
-        }
-        for task in status.get("tasks", [])
-    ]
-
-    # Extract warnings with full details
-    warnings = [
-        {
-            "code": warning.get("code"),
-            "message": warning.get("message"),
-            "details": warning.get("details"),
-        }
-        for warning in status.get("warnings", [])
-    ]
-
-    return {
-        "id": data.get("id"),
-        "schema": data.get("schema"),
-        "service": data.get("service"),
-        "group_id": data.get("group_id"),
-        "paused": data.get("paused"),
-        "sync_frequency": data.get("sync_frequency"),
-        "schedule_type": data.get("schedule_type"),
-        "daily_sync_time": data.get("daily_sync_time"),
-        "data_delay_sensitivity": data.get("data_delay_sensitivity"),
-        "status": {
-            "sync_state": status.get("sync_state"),
-            "setup_state": status.get("setup_state"),
-            "update_state": status.get("update_state"),
-            "is_historical_sync": status.get("is_historical_sync"),
-            "rescheduled_for": status.get("rescheduled_for"),
-            "schema_status": status.get("schema_status"),
-        },
-        "tasks": tasks,
-        "warnings": warnings,
-        "source_sync_details": data.get("source_sync_details"),
-        "succeeded_at": data.get("succeeded_at"),
-        "failed_at": data.get("failed_at"),
-        "created_at": data.get("created_at"),
-    }
+    return _extract_connection_status(result.get("data") or _EMPTY_DICT)
 
 
 @mcp.tool
@@ -120,12 +145,7 @@ async def trigger_sync(connection_id: str, force: bool = False) -> dict[str, Any
         Dictionary with sync trigger confirmation
     """
     client = _get_client()
-    result = await client.trigger_sync(connection_id, force=force)
-    return {
-        "success": True,
-        "message": result.get("message", "Sync triggered successfully"),
-        "connection_id": connection_id,
-    }
+    return await _trigger_sync(client, connection_id, force)
 
 
 @mcp.tool
@@ -143,11 +163,7 @@ async def trigger_resync(connection_id: str) -> dict[str, Any]:
     """
     client = _get_client()
     result = await client.trigger_resync(connection_id)
-    return {
-        "success": True,
-        "message": result.get("message", "Historical resync triggered successfully"),
-        "connection_id": connection_id,
-    }
+    return _confirmation(result, connection_id, _MSG_RESYNC)
 
 
 @mcp.tool
@@ -166,12 +182,9 @@ async def resync_tables(connection_id: str, tables: list[str]) -> dict[str, Any]
     """
     client = _get_client()
     result = await client.resync_tables(connection_id, tables)
-    return {
-        "success": True,
-        "message": result.get("message", "Table resync triggered successfully"),
-        "connection_id": connection_id,
-        "tables": tables,
-    }
+    response = _confirmation(result, connection_id, _MSG_TABLES)
+    response["tables"] = tables
+    return response
 
 
 @mcp.tool
@@ -187,14 +200,7 @@ async def pause_connection(connection_id: str) -> dict[str, Any]:
         Dictionary with updated connection status
     """
     client = _get_client()
-    result = await client.pause_connection(connection_id)
-    data = result.get("data", {})
-    return {
-        "success": True,
-        "connection_id": connection_id,
-        "paused": data.get("paused", True),
-        "message": "Connection paused successfully",
-    }
+    return await _set_paused(client, connection_id, True)
 
 
 @mcp.tool
@@ -210,14 +216,81 @@ async def resume_connection(connection_id: str) -> dict[str, Any]:
         Dictionary with updated connection status
     """
     client = _get_client()
-    result = await client.resume_connection(connection_id)
-    data = result.get("data", {})
-    return {
-        "success": True,
-        "connection_id": connection_id,
-        "paused": data.get("paused", False),
-        "message": "Connection resumed successfully",
-    }
+    return await _set_paused(client, connection_id, False)
+
+
+@mcp.tool
+async def get_connection_statuses(connection_ids: list[str]) -> dict[str, Any]:
+    """Get detailed status for several Fivetran connections at once.
+
+    Fetches all connections concurrently instead of one tool call per connection.
+    Each result has the same shape as get_connection_status.
+
+    Args:
+        connection_ids: The unique identifiers of the connections
+
+    Returns:
+        Dictionary containing one result per connection in request order; a
+        connection that could not be fetched has an error message instead
+    """
+    client = _get_client()
+
+    async def get_status(connection_id: str) -> dict[str, Any]:
+        result = await client.get_connection(connection_id)
+        return _extract_connection_status(result.get("data") or _EMPTY_DICT)
+
+    return await _gather_for_connections(connection_ids, get_status)
+
+
+@mcp.tool
+async def trigger_syncs(
+    connection_ids: list[str], force: bool = False
+) -> dict[str, Any]:
+    """Trigger data syncs for several Fivetran connections at once.
+
+    Args:
+        connection_ids: The unique identifiers of the connections
+        force: If True, force each sync even if one is already in progress
+
+    Returns:
+        Dictionary containing one sync confirmation or error per connection
+    """
+    client = _get_client()
+    return await _gather_for_connections(
+        connection_ids, lambda cid: _trigger_sync(client, cid, force)
+    )
+
+
+@mcp.tool
+async def pause_connections(connection_ids: list[str]) -> dict[str, Any]:
+    """Pause several Fivetran connections at once.
+
+    Args:
+        connection_ids: The unique identifiers of the connections
+
+    Returns:
+        Dictionary containing one updated status or error per connection
+    """
+    client = _get_client()
+    return await _gather_for_connections(
+        connection_ids, lambda cid: _set_paused(client, cid, True)
+    )
+
+
+@mcp.tool
+async def resume_connections(connection_ids: list[str]) -> dict[str, Any]:
+    """Resume several paused Fivetran connections at once.
+
+    Args:
+        connection_ids: The unique identifiers of the connections
+
+    Returns:
+        Dictionary containing one updated status or error per connection
+    """
+    client = _get_client()
+    return await _gather_for_connections(
+        connection_ids, lambda cid: _set_paused(client, cid, False)
+    )
 
 
 @mcp.tool
@@ -232,12 +305,13 @@ async def list_groups(limit: int = 100) -> dict[str, Any]:
     Returns:
         Dictionary containing list of groups with their IDs and names
     """
+    limit = max(1, min(limit, _MAX_PAGE_SIZE))
     client = _get_client()
     result = await client.list_groups(limit=limit)
 
     groups = [
         {"id": group.get("id"), "name": group.get("name"), "created_at": group.get("created_at")}
-        for group in result.get("data", {}).get("items", [])
+        for group in (result.get("data") or _EMPTY_DICT).get("items") or _EMPTY_TUPLE
     ]
     return {"groups": groups, "count": len(groups)}
 
@@ -258,7 +332,7 @@ async def test_connection(connection_id: str) -> dict[str, Any]:
     """
     client = _get_client()
     result = await client.test_connection(connection_id)
-    data = result.get("data", {})
+    data = result.get("data") or _EMPTY_DICT
 
     tests = [
         {
@@ -267,7 +341,7 @@ async def test_connection(connection_id: str) -> dict[str, Any]:
             "message": test.get("message"),
             "details": test.get("details"),
         }
-        for test in data.get("setup_tests", [])
+        for test in data.get("setup_tests") or _EMPTY_TUPLE
     ]
 
     passed_count = sum(1 for t in tests if t["status"] == "PASSED")
@@ -300,7 +374,7 @@ async def get_schema(connection_id: str) -> dict[str, Any]:
     """
     client = _get_client()
     result = await client.get_schema(connection_id)
-    data = result.get("data", {})
+    data = result.get("data") or _EMPTY_DICT
 
     return {
         "connection_id": connection_id,
@@ -351,9 +425,9 @@ async def get_connection_schema(
             connection_id, schema_name, table_name
         )
 
-        schemas = schema_result.get("data", {}).get("schemas", {})
-        schema_data = schemas.get(schema_name, {})
-        table_data = schema_data.get("tables", {}).get(table_name, {})
+        schemas = (schema_result.get("data") or _EMPTY_DICT).get("schemas") or _EMPTY_DICT
+        schema_data = schemas.get(schema_name) or _EMPTY_DICT
+        table_data = (schema_data.get("tables") or _EMPTY_DICT).get(table_name) or _EMPTY_DICT
 
         columns = [
             {
@@ -364,9 +438,9 @@ async def get_connection_schema(
                 "is_primary_key": col_data.get("is_primary_key", False),
                 "enabled_patch_settings": col_data.get("enabled_patch_settings"),
             }
-            for col_name, col_data in columns_result.get("data", {})
-            .get("columns", {})
-            .items()
+            for col_name, col_data in (
+                (columns_result.get("data") or _EMPTY_DICT).get("columns") or _EMPTY_DICT
+            ).items()
         ]
 
         enabled_columns = sum(1 for c in columns if c["enabled"])
@@ -388,8 +462,8 @@ async def get_connection_schema(
 
     # No table specified - return full schema overview
     result = await client.get_schema(connection_id)
-    data = result.get("data", {})
-    schemas = data.get("schemas", {})
+    data = result.get("data") or _EMPTY_DICT
+    schemas = data.get("schemas") or _EMPTY_DICT
 
     # Build summary with table counts
     schema_summary = []
@@ -397,7 +471,7 @@ async def get_connection_schema(
     enabled_tables = 0
 
     for schema_name, schema_data in schemas.items():
-        tables = schema_data.get("tables", {})
+        tables = schema_data.get("tables") or _EMPTY_DICT
         table_count = len(tables)
         enabled_count = sum(
             1 for t in tables.values() if t.get("enabled", False)
@@ -438,12 +512,12 @@ async def list_tables(connection_id: str) -> dict[str, Any]:
     """
     client = _get_client()
     result = await client.get_schema(connection_id)
-    schemas = result.get("data", {}).get("schemas", {})
+    schemas = (result.get("data") or _EMPTY_DICT).get("schemas") or _EMPTY_DICT
 
     tables = []
     for schema_name, schema_data in schemas.items():
         schema_enabled = schema_data.get("enabled", False)
-        for table_name, table_data in schema_data.get("tables", {}).items():
+        for table_name, table_data in (schema_data.get("tables") or _EMPTY_DICT).items():
             tables.append({
                 "schema": schema_name,
                 "table": table_name,
@@ -485,7 +559,7 @@ async def get_table_columns(
     """
     client = _get_client()
     result = await client.get_table_columns(connection_id, schema, table)
-    data = result.get("data", {})
+    data = result.get("data") or _EMPTY_DICT
 
     columns = [
         {
@@ -496,7 +570,7 @@ async def get_table_columns(
             "is_primary_key": col_data.get("is_primary_key", False),
             "enabled_patch_settings": col_data.get("enabled_patch_settings"),
         }
-        for col_name, col_data in data.get("columns", {}).items()
+        for col_name, col_data in (data.get("columns") or _EMPTY_DICT).items()
     ]
 
     enabled_count = sum(1 for c in columns if c["enabled"])
@@ -532,7 +606,7 @@ async def reload_schema(connection_id: str) -> dict[str, Any]:
     return {
         "success": True,
         "connection_id": connection_id,
-        "message": "Schema reload triggered successfully",
+        "message": _MSG_RELOAD,
     }
 
 
@@ -572,13 +646,13 @@ async def get_table_status(
 
     # Fetch schema config and table metadata in parallel
     schema_result = await client.get_schema(connection_id)
-    schemas_data = schema_result.get("data", {}).get("schemas", {})
+    schemas_data = (schema_result.get("data") or _EMPTY_DICT).get("schemas") or _EMPTY_DICT
 
     # Try to get table metadata (may fail if no successful sync yet)
     metadata_map: dict[str, dict[str, Any]] = {}
     try:
         metadata_result = await client.get_table_metadata(connection_id)
-        for table in metadata_result.get("data", {}).get("items", []):
+        for table in (metadata_result.get("data") or _EMPTY_DICT).get("items") or _EMPTY_TUPLE:
             # Key by schema.table for lookup
             key = f"{table.get('schema')}.{table.get('table')}"
             metadata_map[key] = table
@@ -595,7 +669,7 @@ async def get_table_status(
 
         schema_enabled = schema_data.get("enabled", False)
 
-        for table_name, table_data in schema_data.get("tables", {}).items():
+        for table_name, table_data in (schema_data.get("tables") or _EMPTY_DICT).items():
             table_enabled = table_data.get("enabled", False)
 
             # Apply enabled filter if specified
@@ -603,7 +677,7 @@ async def get_table_status(
                 continue
 
             full_name = f"{schema_name}.{table_name}"
-            metadata = metadata_map.get(full_name, {})
+            metadata = metadata_map.get(full_name) or _EMPTY_DICT
 
             # Determine effective sync state
             if not schema_enabled:
@@ -655,15 +729,18 @@ async def get_table_status(
 
 def main() -> None:
     """Run the MCP server."""
+    if sys.platform != "win32":
+        try:
+            import uvloop  # type: ignore[import-not-found]
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
 
 
-def _get_client() -> FivetranClient:
-    """Get or create the Fivetran API client."""
-    global _client
-    if _client is not None:
-        return _client
-
+def _build_client() -> FivetranClient:
+    """Create the Fivetran API client from environment credentials."""
     api_key = os.environ.get("FIVETRAN_SYNC_API_KEY") or os.environ.get("FIVETRAN_API_KEY")
     api_secret = os.environ.get("FIVETRAN_SYNC_API_SECRET") or os.environ.get("FIVETRAN_API_SECRET")
 
@@ -673,24 +750,106 @@ def _get_client() -> FivetranClient:
             "(or FIVETRAN_API_KEY and FIVETRAN_API_SECRET) environment variables are required"
         )
 
-    _client = FivetranClient(api_key, api_secret)
-    return _client
+    return FivetranClient(api_key, api_secret)
+
+
+# The client is built once on first use; a failed build is not cached, so a
+# missing credential is reported again on the next call.
+_get_client = functools.lru_cache(maxsize=1)(_build_client)
 
 
-def _extract_connection_summary(conn: dict[str, Any]) -> dict[str, Any]:
+def _extract_connection_summary(conn: Mapping[str, Any]) -> dict[str, Any]:
     """Extract a summary of connection data for list responses."""
-    status = conn.get("status", {})
+    status = conn.get("status") or _EMPTY_DICT
+    summary = dict(zip(_SUMMARY_KEYS, map(conn.get, _SUMMARY_KEYS)))
+    summary.update(zip(_SUMMARY_STATUS_KEYS, map(status.get, _SUMMARY_STATUS_KEYS)))
+    return summary
+
+
+def _extract_connection_status(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Extract detailed connection status, including tasks and warnings."""
+    status = data.get("status") or _EMPTY_DICT
+    result = dict(zip(_DETAIL_KEYS, map(data.get, _DETAIL_KEYS)))
+    result["status"] = dict(zip(_DETAIL_STATUS_KEYS, map(status.get, _DETAIL_STATUS_KEYS)))
+    # Tasks and warnings keep their full details for troubleshooting
+    result["tasks"] = list(map(_extract_notice, status.get("tasks") or _EMPTY_TUPLE))
+    result["warnings"] = list(map(_extract_notice, status.get("warnings") or _EMPTY_TUPLE))
+    return result
+
+
+def _extract_notice(notice: Mapping[str, Any]) -> dict[str, Any]:
+    """Extract the code, message and details of a connection task or warning."""
+    return dict(zip(_NOTICE_KEYS, map(notice.get, _NOTICE_KEYS)))
+
+
+def _confirmation(
+    result: dict[str, Any], connection_id: str, default_message: str
+) -> dict[str, Any]:
+    """Build the confirmation response for a sync or resync request."""
+    return {
+        "success": True,
+        "message": result.get("message", default_message),
+        "connection_id": connection_id,
+    }
+
+
+async def _trigger_sync(
+    client: FivetranClient, connection_id: str, force: bool
+) -> dict[str, Any]:
+    """Trigger a sync and build the confirmation response."""
+    result = await client.trigger_sync(connection_id, force=force)
+    return _confirmation(result, connection_id, _MSG_SYNC)
+
+
+async def _set_paused(
+    client: FivetranClient, connection_id: str, paused: bool
+) -> dict[str, Any]:
+    """Pause or resume a connection and build the status response."""
+    if paused:
+        result = await client.pause_connection(connection_id)
+    else:
+        result = await client.resume_connection(connection_id)
+    data = result.get("data") or _EMPTY_DICT
+    return {
+        "success": True,
+        "connection_id": connection_id,
+        "paused": data.get("paused", paused),
+        "message": _MSG_PAUSE if paused else _MSG_RESUME,
+    }
+
+
+async def _gather_for_connections(
+    connection_ids: list[str],
+    operation: Callable[[str], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Run an operation for each connection concurrently and collect the results.
+
+    At most _BATCH_CONCURRENCY operations run at once. A failure for one
+    connection is reported in its result instead of failing the whole batch.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run(connection_id: str) -> dict[str, Any]:
+        async with semaphore:
+            return await operation(connection_id)
+
+    outcomes = await asyncio.gather(
+        *(run(cid) for cid in connection_ids), return_exceptions=True
+    )
+    results: list[dict[str, Any]] = []
+    for cid, outcome in zip(connection_ids, outcomes):
+        if isinstance(outcome, Exception):
+            # Some errors, such as httpx timeouts, have an empty message
+            results.append({"connection_id": cid, "error": str(outcome) or type(outcome).__name__})
+        elif isinstance(outcome, BaseException):
+            # Cancellation is not a per-connection failure; let it propagate
+            raise outcome
+        else:
+            results.append(outcome)
     return {
-        "id": conn.get("id"),
-        "schema": conn.get("schema"),
-        "service": conn.get("service"),
-        "group_id": conn.get("group_id"),
-        "paused": conn.get("paused"),
-        "sync_state": status.get("sync_state"),
-        "setup_state": status.get("setup_state"),
-        "is_historical_sync": status.get("is_historical_sync"),
-        "succeeded_at": conn.get("succeeded_at"),
-        "failed_at": conn.get("failed_at"),
+        "results": results,
+        "count": len(results),
+        "error_count": sum(1 for r in results if "error" in r),
     }
 
 
@@ -1,9 +1,12 @@
 """Tests for Fivetran API client."""
 
+import asyncio
+
 import httpx
 import pytest
 import respx
 
+from fivetran_mcp import fivetran_api
 from fivetran_mcp.fivetran_api import FivetranAPIError, FivetranClient
 
 
@@ -180,3 +183,164 @@ async def test_test_connection_success(client, mock_api):
     result = await client.test_connection("conn_123")
     assert len(result["data"]["setup_tests"]) == 2
     assert result["data"]["setup_tests"][0]["status"] == "PASSED"
+
+
+@pytest.mark.asyncio
+async def test_get_schema_is_cached(client, mock_api):
+    """Test that repeated schema reads are served from the cache."""
+    route = mock_api.get("/v1/connections/conn_123/schemas").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"schemas": {}}})
+    )
+
+    first = await client.get_schema("conn_123")
+    second = await client.get_schema("conn_123")
+
+    assert route.call_count == 1
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_list_cache_is_keyed_by_params(client, mock_api):
+    """Test that list responses for different pages are cached separately."""
+    route = mock_api.get("/v1/groups").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"items": []}})
+    )
+
+    await client.list_groups(limit=10)
+    await client.list_groups(limit=10)
+    await client.list_groups(limit=20)
+
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cached_connection_data(client, mock_api):
+    """Test that pausing a connection drops its cached schema and connection lists."""
+    schema_route = mock_api.get("/v1/connections/conn_123/schemas").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"schemas": {}}})
+    )
+    list_route = mock_api.get("/v1/connections").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"items": []}})
+    )
+    other_route = mock_api.get("/v1/connections/conn_456/schemas").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"schemas": {}}})
+    )
+    mock_api.patch("/v1/connections/conn_123").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"paused": True}})
+    )
+
+    await client.get_schema("conn_123")
+    await client.get_schema("conn_456")
+    await client.list_connections()
+    await client.pause_connection("conn_123")
+    await client.get_schema("conn_123")
+    await client.get_schema("conn_456")
+    await client.list_connections()
+
+    assert schema_route.call_count == 2
+    assert list_route.call_count == 2
+    assert other_route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_status_is_briefly_cached(client, mock_api, monkeypatch):
+    """Test that polling a connection is served from the cache until a write or expiry."""
+    now = 1000.0
+    monkeypatch.setattr(fivetran_api.time, "monotonic", lambda: now)
+    route = mock_api.get("/v1/connections/conn_123").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"paused": False}})
+    )
+    mock_api.post("/v1/connections/conn_123/sync").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "message": "Sync triggered"})
+    )
+
+    await client.get_connection("conn_123")
+    await client.get_connection("conn_123")
+    assert route.call_count == 1
+
+    await client.trigger_sync("conn_123")
+    await client.get_connection("conn_123")
+    assert route.call_count == 2
+
+    now += fivetran_api._CONNECTION_CACHE_TTL + 1
+    await client.get_connection("conn_123")
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_read_in_flight_during_write_is_not_cached(client, mock_api):
+    """Test that a list fetched before a concurrent pause finishes is not cached."""
+    release = asyncio.Event()
+    responses = iter([{"paused": False}, {"paused": True}])
+
+    async def list_connections(request):
+        body = {"code": "Success", "data": {"items": [{"id": "c1", **next(responses)}]}}
+        await release.wait()
+        return httpx.Response(200, json=body)
+
+    list_route = mock_api.get("/v1/connections").mock(side_effect=list_connections)
+    mock_api.patch("/v1/connections/c1").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"paused": True}})
+    )
+
+    pending = asyncio.create_task(client.list_connections())
+    await asyncio.sleep(0)
+    await client.pause_connection("c1")
+    release.set()
+    assert (await pending)["data"]["items"][0]["paused"] is False
+
+    result = await client.list_connections()
+
+    assert result["data"]["items"][0]["paused"] is True
+    assert list_route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_use_basic_auth(client, mock_api):
+    """Test that requests authenticate with the base64-encoded credentials."""
+    route = mock_api.get("/v1/connections/conn_123").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {}})
+    )
+
+    await client.get_connection("conn_123")
+
+    # base64("test_key:test_secret")
+    assert route.calls.last.request.headers["Authorization"] == "Basic dGVzdF9rZXk6dGVzdF9zZWNyZXQ="
+
+
+@pytest.mark.asyncio
+async def test_requests_accept_compressed_responses(client, mock_api):
+    """Test that requests advertise gzip and brotli response encodings."""
+    route = mock_api.get("/v1/connections/conn_123").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {}})
+    )
+
+    await client.get_connection("conn_123")
+
+    accept_encoding = route.calls.last.request.headers["Accept-Encoding"]
+    assert "gzip" in accept_encoding
+    assert "br" in accept_encoding
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_entry_is_revalidated_with_etag(client, mock_api, monkeypatch):
+    """Test that an expired schema is revalidated and reused on 304 Not Modified."""
+    route = mock_api.get("/v1/connections/conn_123/schemas").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"code": "Success", "data": {"schemas": {"public": {}}}},
+                headers={"ETag": '"v1"'},
+            ),
+            httpx.Response(304),
+        ]
+    )
+
+    first = await client.get_schema("conn_123")
+    now = fivetran_api.time.monotonic()
+    monkeypatch.setattr(fivetran_api.time, "monotonic", lambda: now + 3600)
+    second = await client.get_schema("conn_123")
+
+    assert route.call_count == 2
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+    assert second == first
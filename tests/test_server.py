@@ -1,17 +1,21 @@
 """Tests for Fivetran MCP server tools."""
 
+import asyncio
+import json
 import os
 from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
+from fastmcp import Client
 
 from fivetran_mcp import server
 
 
 # Access the underlying functions (not the FunctionTool wrappers)
 # Using underscore prefix to avoid pytest picking them up as test functions
+_list_connections = server.list_connections.fn
 _get_connection_status = server.get_connection_status.fn
 _get_schema = server.get_schema.fn
 _get_connection_schema = server.get_connection_schema.fn
@@ -19,14 +23,17 @@ _list_tables = server.list_tables.fn
 _get_table_columns = server.get_table_columns.fn
 _reload_schema = server.reload_schema.fn
 _test_connection = server.test_connection.fn
+_get_connection_statuses = server.get_connection_statuses.fn
+_pause_connections = server.pause_connections.fn
+_resume_connection = server.resume_connection.fn
 
 
 @pytest.fixture(autouse=True)
 def reset_client():
-    """Reset the global client before each test."""
-    server._client = None
+    """Reset the cached client before each test."""
+    server._get_client.cache_clear()
     yield
-    server._client = None
+    server._get_client.cache_clear()
 
 
 @pytest.fixture
@@ -39,6 +46,86 @@ def mock_env():
         yield
 
 
+@pytest.mark.asyncio
+async def test_list_connections_returns_summaries(mock_env, mock_api):
+    """Test list_connections summarizes each connection and its sync status."""
+    mock_api.get("/v1/connections").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "code": "Success",
+                "data": {
+                    "items": [
+                        {
+                            "id": "conn_1",
+                            "schema": "salesforce",
+                            "service": "salesforce",
+                            "group_id": "group_1",
+                            "paused": False,
+                            "succeeded_at": "2024-01-01T00:00:00Z",
+                            "status": {"sync_state": "scheduled", "setup_state": "connected"},
+                        },
+                        {"id": "conn_2", "paused": True},
+                    ]
+                },
+            },
+        )
+    )
+
+    result = await _list_connections()
+
+    assert result["count"] == 2
+    assert result["connections"][0] == {
+        "id": "conn_1",
+        "schema": "salesforce",
+        "service": "salesforce",
+        "group_id": "group_1",
+        "paused": False,
+        "succeeded_at": "2024-01-01T00:00:00Z",
+        "failed_at": None,
+        "sync_state": "scheduled",
+        "setup_state": "connected",
+        "is_historical_sync": None,
+    }
+    assert result["connections"][1]["paused"] is True
+    assert result["connections"][1]["sync_state"] is None
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_connections_passes_cursor(mock_env, mock_api):
+    """Test list_connections forwards the cursor and returns the next one."""
+    route = mock_api.get("/v1/groups/group_1/connections").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "code": "Success",
+                "data": {"items": [{"id": "conn_3"}], "next_cursor": "page_3"},
+            },
+        )
+    )
+
+    result = await _list_connections(limit=1, group_id="group_1", cursor="page_2")
+
+    assert route.calls[0].request.url.params["cursor"] == "page_2"
+    assert route.calls[0].request.url.params["limit"] == "1"
+    assert result["count"] == 1
+    assert result["next_cursor"] == "page_3"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("limit", "expected"), [(0, "1"), (50, "50"), (100000, "1000")])
+async def test_list_connections_clamps_limit(mock_env, mock_api, limit, expected):
+    """Test list_connections keeps the requested page size within the API's bounds."""
+    route = mock_api.get("/v1/connections").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"items": []}})
+    )
+
+    await _list_connections(limit=limit)
+
+    assert route.calls[0].request.url.params["limit"] == expected
+
+
 @pytest.mark.asyncio
 async def test_get_connection_status_with_details(mock_env, mock_api):
     """Test get_connection_status returns full task and warning details."""
@@ -94,6 +181,15 @@ async def test_get_connection_status_with_details(mock_env, mock_api):
     assert result["daily_sync_time"] == "03:00"
     assert result["data_delay_sensitivity"] == "NORMAL"
     assert result["source_sync_details"] == {"last_synced": "2024-01-01"}
+    assert result["created_at"] == "2023-01-01T00:00:00Z"
+    assert result["status"] == {
+        "sync_state": "syncing",
+        "setup_state": "connected",
+        "update_state": "on_schedule",
+        "is_historical_sync": False,
+        "rescheduled_for": None,
+        "schema_status": "ready",
+    }
 
     # Verify tasks include full details
     assert len(result["tasks"]) == 1
@@ -410,3 +506,145 @@ async def test_test_connection_all_passed(mock_env, mock_api):
     assert result["overall_status"] == "PASSED"
     assert result["passed_count"] == 2
     assert result["failed_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_results_serialized_with_orjson(mock_env, mock_api):
+    """Test tool results are rendered as compact JSON text by the server."""
+    mock_api.get("/v1/groups").mock(
+        return_value=httpx.Response(
+            200,
+            json={"code": "Success", "data": {"items": [{"id": "group_1", "name": "Warehouse"}]}},
+        )
+    )
+
+    async with Client(server.mcp) as client:
+        result = await client.call_tool("list_groups", {})
+
+    assert server.list_groups.serializer is server._serialize_result
+    assert result.content[0].text == (
+        '{"groups":[{"id":"group_1","name":"Warehouse","created_at":null}],"count":1}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_client_on_shutdown(mock_env):
+    """Test that the server lifespan closes the shared client's connection pool."""
+    client = server._get_client()
+
+    async with server._lifespan(server.mcp):
+        assert server._get_client() is client
+
+    assert server._get_client.cache_info().currsize == 0
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_lifespan_builds_client_on_startup(mock_env):
+    """Test that the server lifespan builds the shared client before any tool call."""
+    async with server._lifespan(server.mcp):
+        assert server._get_client.cache_info().currsize == 1
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_without_credentials():
+    """Test that missing credentials do not stop the server from starting."""
+    with patch.dict(os.environ, {}, clear=True):
+        async with server._lifespan(server.mcp):
+            assert server._get_client.cache_info().currsize == 0
+            with pytest.raises(ValueError):
+                server._get_client()
+
+
+@pytest.mark.asyncio
+async def test_get_connection_statuses_reports_each_connection(mock_env, mock_api):
+    """Test get_connection_statuses returns per-connection status and errors in order."""
+    mock_api.get("/v1/connections/conn_1").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "code": "Success",
+                "data": {
+                    "id": "conn_1",
+                    "paused": False,
+                    "status": {"sync_state": "scheduled", "tasks": [], "warnings": []},
+                },
+            },
+        )
+    )
+    mock_api.get("/v1/connections/missing").mock(
+        return_value=httpx.Response(
+            404, json={"code": "NotFound", "message": "Connection not found"}
+        )
+    )
+
+    result = await _get_connection_statuses(["conn_1", "missing"])
+
+    assert result["count"] == 2
+    assert result["error_count"] == 1
+    assert result["results"][0]["id"] == "conn_1"
+    assert result["results"][0]["status"]["sync_state"] == "scheduled"
+    assert result["results"][1]["connection_id"] == "missing"
+    assert "Connection not found" in result["results"][1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_resume_connection_reports_unpaused(mock_env, mock_api):
+    """Test resume_connection unpauses the connection and confirms it."""
+    route = mock_api.patch("/v1/connections/conn_123").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"paused": False}})
+    )
+
+    result = await _resume_connection("conn_123")
+
+    assert json.loads(route.calls[0].request.content) == {"paused": False}
+    assert result == {
+        "success": True,
+        "connection_id": "conn_123",
+        "paused": False,
+        "message": "Connection resumed successfully",
+    }
+
+
+@pytest.mark.asyncio
+async def test_pause_connections_pauses_each_connection(mock_env, mock_api):
+    """Test pause_connections sends one pause request per connection."""
+    route = mock_api.patch(url__regex=r"/v1/connections/conn_\d").mock(
+        return_value=httpx.Response(200, json={"code": "Success", "data": {"paused": True}})
+    )
+
+    result = await _pause_connections(["conn_1", "conn_2", "conn_3"])
+
+    assert route.call_count == 3
+    assert result["error_count"] == 0
+    assert [r["connection_id"] for r in result["results"]] == ["conn_1", "conn_2", "conn_3"]
+    assert all(r["paused"] is True for r in result["results"])
+
+
+@pytest.mark.asyncio
+async def test_gather_for_connections_names_errors_without_a_message():
+    """Test that a failure with an empty message is reported by its exception type."""
+
+    async def operation(connection_id: str) -> dict:
+        if connection_id == "slow":
+            raise httpx.ReadTimeout("")
+        return {"connection_id": connection_id}
+
+    result = await server._gather_for_connections(["ok", "slow"], operation)
+
+    assert result["results"] == [
+        {"connection_id": "ok"},
+        {"connection_id": "slow", "error": "ReadTimeout"},
+    ]
+    assert result["error_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gather_for_connections_propagates_cancellation():
+    """Test that a cancelled operation cancels the batch instead of becoming a result."""
+
+    async def operation(connection_id: str) -> dict:
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await server._gather_for_connections(["conn_1"], operation)
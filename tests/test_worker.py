@@ -0,0 +1,453 @@
+"""Tests for the Cloudflare Workers entry point.
+
+The worker imports the Workers runtime modules ``js`` and ``pyodide.ffi``,
+which only exist inside Pyodide, so these tests load it against minimal
+stand-ins that record outgoing fetch calls and serve canned responses.
+"""
+
+import asyncio
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+WORKER_PATH = Path(__file__).parent.parent / "cloudflare" / "src" / "worker.py"
+BASE_URL = "https://api.fivetran.com/v1"
+
+
+class FakeHeaders(dict):
+    """Case-insensitive stand-in for the JS Headers class."""
+
+    @classmethod
+    def new(cls, init=None):
+        return cls({k.lower(): v for k, v in dict(init or {}).items()})
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+    def set(self, name, value):
+        self[name.lower()] = value
+
+
+class FakeResponse:
+    """Stand-in for both fetch() results and Response.new() objects."""
+
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = FakeHeaders.new(headers)
+
+    @classmethod
+    def new(cls, body, options=None):
+        options = options or {}
+        return cls(options.get("status", 200), body, options.get("headers"))
+
+    async def arrayBuffer(self):
+        return types.SimpleNamespace(to_bytes=lambda: self.body)
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class FakeFivetran:
+    """Serves canned Fivetran responses to the worker's fetch calls."""
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+        self.held = {}
+
+    def add(self, method, path, status=200, json_body=None, headers=None):
+        """Queue a response; the last queued response for a route repeats."""
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        self.routes.setdefault((method, path), []).append((status, body, headers))
+
+    def hold(self, method, path):
+        """Hold responses for a route until the returned event is set."""
+        return self.held.setdefault((method, path), asyncio.Event())
+
+    def count(self, method, path):
+        return sum(1 for call in self.calls if call[:2] == (method, path))
+
+    async def fetch(self, url, options):
+        path = url.removeprefix(BASE_URL)
+        self.calls.append((options["method"], path, options["headers"]))
+        await asyncio.sleep(0)
+        if (options["method"], path) in self.held:
+            await self.held[(options["method"], path)].wait()
+        responses = self.routes[(options["method"], path)]
+        status, body, headers = responses.pop(0) if len(responses) > 1 else responses[0]
+        return FakeResponse(status, body, headers)
+
+
+@pytest.fixture
+def fivetran():
+    """Fixture that provides the fake Fivetran API behind the worker's fetch."""
+    return FakeFivetran()
+
+
+@pytest.fixture
+def worker(fivetran, monkeypatch):
+    """Fixture that imports a fresh copy of the worker against fake runtime modules."""
+    js = types.ModuleType("js")
+    js.Object = types.SimpleNamespace(fromEntries=dict)
+    js.Headers = FakeHeaders
+    js.Response = FakeResponse
+    js.fetch = fivetran.fetch
+    ffi = types.ModuleType("pyodide.ffi")
+    ffi.to_js = lambda value, dict_converter=None: (
+        dict_converter(value.items()) if dict_converter else value
+    )
+    monkeypatch.setitem(sys.modules, "js", js)
+    monkeypatch.setitem(sys.modules, "pyodide", types.ModuleType("pyodide"))
+    monkeypatch.setitem(sys.modules, "pyodide.ffi", ffi)
+
+    spec = importlib.util.spec_from_file_location("worker", WORKER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def clock(worker, monkeypatch):
+    """Fixture that freezes the worker's monotonic clock; advance it via clock.now."""
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(worker.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+@pytest.fixture
+def client(worker):
+    """Fixture that provides a worker FivetranClient."""
+    return worker.FivetranClient("test_key", "test_secret")
+
+
+class FakeContext:
+    """Stand-in for the Workers execution context; records waitUntil tasks."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def waitUntil(self, task):
+        self.tasks.append(task)
+
+    async def drain(self):
+        """Wait for every registered task, including ones registered meanwhile."""
+        done = 0
+        while done < len(self.tasks):
+            await self.tasks[done]
+            done += 1
+
+
+class FakeRequest:
+    """Stand-in for an incoming Workers request."""
+
+    def __init__(self, body, path="/execute", method="POST"):
+        self.url = f"https://fivetran-mcp.example.workers.dev{path}"
+        self.method = method
+        self._body = json.dumps(body)
+
+    async def text(self):
+        return self._body
+
+
+def _success(data):
+    return {"code": "Success", "data": data}
+
+
+async def _execute(worker, body, ctx=None):
+    """Send a tool call through the worker's fetch handler."""
+    env = types.SimpleNamespace(FIVETRAN_API_KEY="test_key", FIVETRAN_API_SECRET="test_secret")
+    ctx = ctx or FakeContext()
+    return await worker.on_fetch(FakeRequest(body), env, ctx)
+
+
+def test_cache_ttl_by_endpoint(worker):
+    """Test that only list and schema reads are cached, each with its own TTL."""
+    assert worker._cache_ttl("/connectors/conn_1/schemas") == worker._SCHEMA_CACHE_TTL
+    assert worker._cache_ttl("/groups?limit=100") == worker._LIST_CACHE_TTL
+    assert worker._cache_ttl("/connections?limit=100") == worker._LIST_CACHE_TTL
+    assert worker._cache_ttl("/groups/group_1/connectors?limit=5") == worker._LIST_CACHE_TTL
+    assert worker._cache_ttl("/connectors/conn_1") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_read_is_reused(client, fivetran, clock):
+    """Test that a fresh cached response is served without another fetch."""
+    fivetran.add("GET", "/groups?limit=100", json_body=_success({"items": [{"id": "g1"}]}))
+
+    first = await client.list_groups()
+    second = await client.list_groups()
+
+    assert second is first
+    assert fivetran.count("GET", "/groups?limit=100") == 1
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cached_connection_data(client, fivetran, clock):
+    """Test that pausing a connection drops its cached schema and connection lists."""
+    fivetran.add("GET", "/connectors/conn_1/schemas", json_body=_success({"schemas": {}}))
+    fivetran.add("GET", "/connectors/conn_2/schemas", json_body=_success({"schemas": {}}))
+    fivetran.add("GET", "/connections?limit=100", json_body=_success({"items": []}))
+    fivetran.add("PATCH", "/connectors/conn_1", json_body=_success({"paused": True}))
+
+    for _ in range(2):
+        await client.get_schema("conn_1")
+        await client.get_schema("conn_2")
+        await client.list_connections()
+        await client.pause_connection("conn_1")
+
+    assert fivetran.count("GET", "/connectors/conn_1/schemas") == 2
+    assert fivetran.count("GET", "/connections?limit=100") == 2
+    assert fivetran.count("GET", "/connectors/conn_2/schemas") == 1
+
+
+@pytest.mark.asyncio
+async def test_error_response_is_not_cached(client, fivetran, clock, worker):
+    """Test that a failed read is fetched again rather than served from the cache."""
+    fivetran.add("GET", "/groups?limit=100", status=500, json_body={"code": "ServerError"})
+    fivetran.add("GET", "/groups?limit=100", json_body=_success({"items": []}))
+
+    with pytest.raises(worker.FivetranAPIError):
+        await client.list_groups()
+    result = await client.list_groups()
+
+    assert result == _success({"items": []})
+    assert fivetran.count("GET", "/groups?limit=100") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "body"),
+    [
+        (404, {"code": "NotFound_Connection", "message": "Connection not found"}),
+        (200, {"code": "NotFound_Connection", "message": "Connection not found"}),
+        (502, None),
+    ],
+)
+async def test_error_response_raises(client, fivetran, worker, status, body):
+    """Test that an error status or a non-Success code raises FivetranAPIError."""
+    fivetran.add("PATCH", "/connectors/conn_1", status=status, json_body=body)
+
+    with pytest.raises(worker.FivetranAPIError) as exc_info:
+        await client.pause_connection("conn_1")
+
+    assert exc_info.value.status_code == status
+    assert exc_info.value.message == ("Connection not found" if body else "Unknown error")
+
+
+@pytest.mark.asyncio
+async def test_entry_near_expiry_is_refreshed_in_background(client, fivetran, clock, worker):
+    """Test that a cache hit close to expiry returns the cached body and refreshes it."""
+    fivetran.add("GET", "/groups?limit=100", json_body=_success({"items": []}))
+    fivetran.add("GET", "/groups?limit=100", json_body=_success({"items": [{"id": "g1"}]}))
+
+    ctx = FakeContext()
+    worker._request_ctx.set(ctx)
+    stale = await client.list_groups()
+    clock.now += worker._LIST_CACHE_TTL - worker._CACHE_REFRESH_AHEAD / 2
+
+    assert await client.list_groups() is stale
+    assert len(ctx.tasks) == 1
+    await ctx.drain()
+
+    assert fivetran.count("GET", "/groups?limit=100") == 2
+    assert await client.list_groups() == _success({"items": [{"id": "g1"}]})
+    assert fivetran.count("GET", "/groups?limit=100") == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_in_flight_during_write_is_not_cached(client, fivetran, clock, worker):
+    """Test that a background refresh that started before a pause does not cache its result."""
+    path = "/connections?limit=100"
+    for paused in (False, False, True):
+        fivetran.add("GET", path, json_body=_success({"items": [{"id": "conn_1", "paused": paused}]}))
+    fivetran.add("PATCH", "/connectors/conn_1", json_body=_success({"paused": True}))
+
+    await client.list_connections()
+    clock.now += worker._LIST_CACHE_TTL - worker._CACHE_REFRESH_AHEAD / 2
+    release = fivetran.hold("GET", path)
+    await client.list_connections()
+    refresh = client._refreshing[path]
+
+    await client.pause_connection("conn_1")
+    release.set()
+    await refresh
+    result = await client.list_connections()
+
+    assert result["data"]["items"][0]["paused"] is True
+    assert fivetran.count("GET", path) == 3
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_etag(client, fivetran, clock, worker):
+    """Test that an expired entry is revalidated and reused on 304 Not Modified."""
+    fivetran.add(
+        "GET", "/connectors/conn_1/schemas",
+        json_body=_success({"schemas": {}}), headers={"ETag": '"v1"'},
+    )
+    fivetran.add("GET", "/connectors/conn_1/schemas", status=304)
+
+    first = await client.get_schema("conn_1")
+    clock.now += worker._SCHEMA_CACHE_TTL + 1
+    second = await client.get_schema("conn_1")
+
+    assert second is first
+    assert fivetran.calls[-1][2].get("If-None-Match") == '"v1"'
+    assert await client.get_schema("conn_1") is first
+    assert fivetran.count("GET", "/connectors/conn_1/schemas") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("connection_ids", ["ab", ["conn_1", 2], {"id": "conn_1"}, None])
+async def test_batch_tool_rejects_invalid_connection_ids(worker, fivetran, connection_ids):
+    """Test that a batch tool answers 400 without calling Fivetran unless given a list of IDs."""
+    arguments = {} if connection_ids is None else {"connection_ids": connection_ids}
+
+    response = await _execute(worker, {"tool": "trigger_sync_batch", "arguments": arguments})
+
+    assert response.status == 400
+    assert "connection_ids" in response.json()["error"]
+    assert fivetran.calls == []
+
+
+@pytest.mark.asyncio
+async def test_tool_list_is_rejected_if_any_batch_arguments_are_invalid(worker, fivetran):
+    """Test that a list of tool calls is validated before any of them runs."""
+    fivetran.add("PATCH", "/connectors/conn_1", json_body=_success({"paused": True}))
+
+    response = await _execute(worker, {
+        "tool": ["pause_connection", "pause_connection_batch"],
+        "arguments": [{"connection_id": "conn_1"}, {"connection_ids": "ab"}],
+    })
+
+    assert response.status == 400
+    assert fivetran.calls == []
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_reports_fivetran_errors_per_connection(worker, fivetran):
+    """Test that a Fivetran error fills its own result slot and is counted."""
+    fivetran.add("PATCH", "/connectors/conn_1", json_body=_success({"paused": True}))
+    fivetran.add(
+        "PATCH", "/connectors/missing", status=404,
+        json_body={"code": "NotFound_Connection", "message": "Connection not found"},
+    )
+
+    response = await _execute(worker, {
+        "tool": "pause_connection_batch",
+        "arguments": {"connection_ids": ["conn_1", "missing"]},
+    })
+
+    result = response.json()["result"]
+    assert result["count"] == 2
+    assert result["error_count"] == 1
+    assert result["results"][0]["paused"] is True
+    assert result["results"][1] == {
+        "connection_id": "missing",
+        "error": "Fivetran API error (404): Connection not found",
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_tables_memo_is_reused_while_schema_is_cached(client, fivetran, clock):
+    """Test that list_tables flattens a cached schema once."""
+    fivetran.add("GET", "/connectors/conn_1/schemas", json_body=_success({
+        "schemas": {"public": {"tables": {"users": {"enabled": True, "sync_mode": "SOFT_DELETE"}}}},
+    }))
+
+    tables = await client.list_tables("conn_1")
+
+    assert await client.list_tables("conn_1") is tables
+    assert tables == [{
+        "schema": "public",
+        "table": "users",
+        "full_name": "public.users",
+        "enabled": True,
+        "sync_mode": "SOFT_DELETE",
+    }]
+
+
+@pytest.mark.asyncio
+async def test_list_tables_memo_is_bounded_by_the_cache(client, fivetran, clock, worker, monkeypatch):
+    """Test that evicting or replacing a cached schema also drops its table list."""
+    monkeypatch.setattr(worker, "_CACHE_MAX_ENTRIES", 2)
+    for cid in ("conn_1", "conn_2", "conn_3"):
+        fivetran.add("GET", f"/connectors/{cid}/schemas", json_body=_success({"schemas": {}}))
+    fivetran.add("GET", "/connectors/conn_3/schemas", json_body=_success({"schemas": {"new": {}}}))
+    for cid in ("conn_1", "conn_2", "conn_3"):
+        await client.list_tables(cid)
+
+    assert set(client._tables) == {"conn_2", "conn_3"}
+
+    clock.now += worker._SCHEMA_CACHE_TTL + 1
+    await client.get_schema("conn_3")
+
+    assert set(client._tables) == {"conn_2"}
+
+
+@pytest.mark.asyncio
+async def test_background_tasks_are_kept_alive_by_the_request_that_started_them(
+    worker, fivetran, clock
+):
+    """Test that concurrent requests each register only their own background tasks."""
+    fivetran.add("GET", "/connections?limit=100", json_body=_success({"items": [{"id": "conn_1"}]}))
+    fivetran.add("GET", "/connectors/conn_1/schemas", json_body=_success({"schemas": {}}))
+    fivetran.add("GET", "/groups?limit=100", json_body=_success({"items": []}))
+    listing, grouping = FakeContext(), FakeContext()
+
+    await asyncio.gather(
+        _execute(worker, {"tool": "list_connections"}, listing),
+        _execute(worker, {"tool": "list_groups"}, grouping),
+    )
+    await listing.drain()
+
+    assert len(listing.tasks) == 1
+    assert grouping.tasks == []
+    assert fivetran.count("GET", "/connectors/conn_1/schemas") == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_started_by_a_prefetch_is_kept_alive(worker, fivetran, clock):
+    """Test that a refresh started inside a prefetch after the response is still registered."""
+    fivetran.add("GET", "/connections?limit=100", json_body=_success({"items": [{"id": "conn_1"}]}))
+    fivetran.add("GET", "/connectors/conn_1/schemas", json_body=_success({"schemas": {}}))
+    await _execute(worker, {"tool": "get_schema", "arguments": {"connection_id": "conn_1"}})
+    clock.now += worker._SCHEMA_CACHE_TTL - worker._CACHE_REFRESH_AHEAD / 2
+    ctx = FakeContext()
+
+    await _execute(worker, {"tool": "list_connections"}, ctx)
+    await ctx.drain()
+
+    # The prefetch hits the cache near expiry, which starts a refresh
+    assert len(ctx.tasks) == 2
+    assert fivetran.count("GET", "/connectors/conn_1/schemas") == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_reports_failures_in_their_slot(worker):
+    """Test that a failed call becomes an error entry, named by type if it has no message."""
+
+    async def succeed():
+        return {"ok": True}
+
+    async def fail(error):
+        raise error
+
+    results = await worker._gather_bounded([succeed(), fail(TimeoutError()), fail(ValueError("bad"))])
+
+    assert results == [{"ok": True}, {"error": "TimeoutError"}, {"error": "bad"}]
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_propagates_cancellation(worker):
+    """Test that a cancelled call cancels the batch instead of becoming a result."""
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await worker._gather_bounded([cancelled()])